@@ -1,11 +1,22 @@
+import functools
 import os
-from flask import Flask, jsonify
+import sys
+from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 
-# สร้าง instance ของ SQLAlchemy และ Migrate
+from app.config import config
+
+# สร้าง instance ของ SQLAlchemy
 db = SQLAlchemy()
-migrate = Migrate()
+
+# Resolve the default configuration name once at import time
+_DEFAULT_CONFIG = os.getenv('FLASK_CONFIG', 'default')
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_config(config_name):
+    """Return the config class registered under config_name."""
+    return config[config_name]
 
 
 def create_app(config_name=None):
@@ -16,10 +27,9 @@ def create_app(config_name=None):
 
     # Load configuration
     if config_name is None:
-        config_name = os.getenv('FLASK_CONFIG', 'default')
+        config_name = _DEFAULT_CONFIG
 
-    from app.config import config
-    app.config.from_object(config[config_name])
+    app.config.from_object(_resolve_config(config_name))
 
     # Ensure DATABASE_URL is set in production
     if config_name == 'production' and not app.config.get('SQLALCHEMY_DATABASE_URI'):
@@ -27,7 +37,16 @@ def create_app(config_name=None):
 
     # Initialize extensions
     db.init_app(app)
-    migrate.init_app(app, db)
+
+    # Flask-Migrate only provides the `flask db` commands, so skip importing it
+    # in request-serving workers (e.g. gunicorn)
+    if os.environ.get('FLASK_RUN_FROM_CLI') or sys.argv[0].endswith('flask'):
+        from flask_migrate import Migrate
+        Migrate(app, db)
+
+    # Serialize JSON responses with orjson
+    from app.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
 
     # Register blueprints
     from .routes import bp as main_bp
@@ -41,21 +60,24 @@ def create_app(config_name=None):
 
 def register_error_handlers(app):
     """Register error handlers for the app."""
+    # The error payloads never change, so serialize them once per app
+    not_found_body = app.json.response_body({
+        "success": False,
+        "error": "Resource not found",
+        "message": "The requested URL was not found on the server."
+    })
+    internal_error_body = app.json.response_body({
+        "success": False,
+        "error": "Internal server error",
+        "message": "An unexpected error has occurred. Please try again later."
+    })
 
     @app.errorhandler(404)
     def not_found_error(error):
-        return jsonify({
-            "success": False,
-            "error": "Resource not found",
-            "message": "The requested URL was not found on the server."
-        }), 404
+        return app.response_class(not_found_body, status=404, mimetype=app.json.mimetype)
 
     @app.errorhandler(500)
     def internal_error(error):
         # Rollback the session in case of a database error
         db.session.rollback()
-        return jsonify({
-            "success": False,
-            "error": "Internal server error",
-            "message": "An unexpected error has occurred. Please try again later."
-        }), 500
+        return app.response_class(internal_error_body, status=500, mimetype=app.json.mimetype)
@@ -1,4 +1,5 @@
 import os
+from sqlalchemy.pool import StaticPool
 
 basedir = os.path.abspath(os.path.dirname(__file__))
 
@@ -22,6 +23,12 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'  # Use in-memory SQLite for tests
     WTF_CSRF_ENABLED = False
+    # Back the in-memory database with one shared connection so every
+    # connection checkout sees the same schema and data
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
 
 
 class ProductionConfig(Config):
@@ -30,6 +37,15 @@ class ProductionConfig(Config):
     # In production, we explicitly want DATABASE_URL to be set.
     # The application factory will check for this.
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
+    # Keep a warm pool of connections and check them before use so stale
+    # connections don't surface as errors after the database restarts.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_timeout': 30,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True
+    }
 
 
 config = {
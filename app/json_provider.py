@@ -0,0 +1,27 @@
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that parses and serializes with orjson.
+
+    Datetimes are encoded natively as ISO 8601 strings, with naive values
+    treated as UTC and suffixed with 'Z'.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def response_body(self, obj):
+        """Serialize obj exactly as response() would, for bodies built ahead of time."""
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return f'{self.dumps(obj, indent=2)}\n'
+        return f'{self.dumps(obj)}\n'
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
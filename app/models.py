@@ -6,10 +6,10 @@ class Todo(db.Model):
     """Todo Model"""
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
-    description = db.Column(db.String(200), nullable=True, default='')
-    completed = db.Column(db.Boolean, default=False, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    description = db.Column(db.String(200), nullable=True)
+    completed = db.Column(db.Boolean, server_default=db.false(), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     def __repr__(self):
         return f'<Todo {self.id}: {self.title}>'
@@ -21,6 +21,18 @@ class Todo(db.Model):
             'title': self.title,
             'description': self.description,
             'completed': self.completed,
-            'created_at': self.created_at.isoformat() + 'Z',
-            'updated_at': self.updated_at.isoformat() + 'Z'
+            'created_at': f'{self.created_at.isoformat()}Z',
+            'updated_at': f'{self.updated_at.isoformat()}Z'
         }
+
+
+def list_todos_query():
+    """Return the statement used to list todos, newest first.
+
+    Selects plain columns rather than Todo instances, so serializing the list
+    can never fall into per-row lazy loads (N+1) once relationships are added.
+    """
+    return db.select(
+        Todo.id, Todo.title, Todo.description, Todo.completed,
+        Todo.created_at, Todo.updated_at
+    ).order_by(Todo.created_at.desc())
@@ -1,29 +1,54 @@
-from flask import Blueprint, jsonify, request
+import hashlib
+
+from flask import Blueprint, abort, current_app, jsonify, request
 from sqlalchemy.exc import SQLAlchemyError
-from app.models import db, Todo
+from app.models import db, Todo, list_todos_query
 
 bp = Blueprint('main', __name__)
 
+# Built once and reused by every health check
+_HEALTH_STMT = db.text('SELECT 1')
+
+# The API root payload is static, so it is serialized once per app
+_INDEX_PAYLOAD = {
+    'message': 'Welcome to the Flask Todo API!',
+    'version': '1.0.0',
+    'endpoints': {
+        'health': '/api/health',
+        'todos': '/api/todos'
+    }
+}
+
+
+@bp.record_once
+def serialize_index(state):
+    """Serialize the static API root payload once per app."""
+    state.app.extensions['main.index_body'] = state.app.json.response_body(_INDEX_PAYLOAD)
+
+
+def _has_title(data):
+    """Return True if data is a dict carrying a non-blank title."""
+    if not isinstance(data, dict):
+        return False
+    title = data.get('title')
+    return isinstance(title, str) and bool(title.strip())
+
 
 @bp.route('/')
 def index():
     """API Root Endpoint"""
-    return jsonify({
-        'message': 'Welcome to the Flask Todo API!',
-        'version': '1.0.0',
-        'endpoints': {
-            'health': '/api/health',
-            'todos': '/api/todos'
-        }
-    })
+    return current_app.response_class(
+        current_app.extensions['main.index_body'], mimetype=current_app.json.mimetype
+    )
 
 
 @bp.route('/api/health')
 def health_check():
     """Health check endpoint"""
     try:
-        # Check database connection
-        db.session.execute(db.text('SELECT 1'))
+        # Check database connection directly on the engine, outside the session
+        with db.engine.connect() as conn:
+            conn.execute(_HEALTH_STMT)
         db_status = 'connected'
         status_code = 200
         overall_status = 'healthy'
@@ -47,12 +72,26 @@ def health_check():
 def get_todos():
     """Get all todo items"""
     try:
-        todos = Todo.query.order_by(Todo.created_at.desc()).all()
-        return jsonify({
+        # Any insert, update or delete changes the row count or latest timestamp
+        count, last_updated = db.session.execute(
+            db.select(db.func.count(Todo.id), db.func.max(Todo.updated_at))
+        ).one()
+        etag = hashlib.md5(f'{count}-{last_updated}'.encode(), usedforsecurity=False).hexdigest()
+        if request.if_none_match.contains(etag):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag)
+            return response
+
+        rows = db.session.execute(list_todos_query()).all()
+        # The JSON provider encodes the datetime columns directly
+        todos = [row._asdict() for row in rows]
+        response = jsonify({
             'success': True,
             'count': len(todos),
-            'data': [todo.to_dict() for todo in todos]
+            'data': todos
         })
+        response.set_etag(etag)
+        return response
     except SQLAlchemyError as e:
         return jsonify({'success': False, 'error': f'Database error: {str(e)}'}), 500
 
@@ -62,7 +101,7 @@ def create_todo():
     """Create a new todo"""
     data = request.get_json()
 
-    if not data or 'title' not in data or not data['title'].strip():
+    if not _has_title(data):
         return jsonify({'success': False, 'error': 'Title is required'}), 400
 
     try:
@@ -82,11 +121,42 @@ def create_todo():
         return jsonify({'success': False, 'error': f'Database error: {str(e)}'}), 500
 
 
+@bp.route('/api/todos/bulk', methods=['POST'])
+def create_todos_bulk():
+    """Create several todos in a single INSERT"""
+    data = request.get_json()
+    items = data.get('items') if isinstance(data, dict) else None
+
+    if not items or not isinstance(items, list):
+        return jsonify({'success': False, 'error': 'Items are required'}), 400
+
+    for item in items:
+        if not _has_title(item):
+            return jsonify({'success': False, 'error': 'Title is required'}), 400
+
+    try:
+        db.session.execute(db.insert(Todo), [
+            {'title': item['title'], 'description': item.get('description', '')}
+            for item in items
+        ])
+        db.session.commit()
+        return jsonify({
+            'success': True,
+            'count': len(items),
+            'message': 'Todos created successfully'
+        }), 201
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'error': f'Database error: {str(e)}'}), 500
+
+
 @bp.route('/api/todos/<int:id>', methods=['GET'])
 def get_todo(id):
     """Get a single todo by its ID"""
     try:
-        todo = Todo.query.get_or_404(id)
+        todo = db.session.get(Todo, id)
+        if todo is None:
+            abort(404)
         return jsonify({
             'success': True,
             'data': todo.to_dict()
@@ -98,10 +168,16 @@ def get_todo(id):
 @bp.route('/api/todos/<int:id>', methods=['PUT'])
 def update_todo(id):
     """Update an existing todo"""
+    data = request.get_json()
+
+    if not isinstance(data, dict) or ('title' in data and not _has_title(data)):
+        return jsonify({'success': False, 'error': 'Title is required'}), 400
+
     try:
-        todo = Todo.query.get_or_404(id)
-        data = request.get_json()
-        
+        todo = db.session.get(Todo, id)
+        if todo is None:
+            abort(404)
+
         todo.title = data.get('title', todo.title)
         todo.description = data.get('description', todo.description)
         todo.completed = data.get('completed', todo.completed)
@@ -121,8 +197,11 @@ def update_todo(id):
 def delete_todo(id):
     """Delete a todo"""
     try:
-        todo = Todo.query.get_or_404(id)
-        db.session.delete(todo)
+        # Delete by primary key in one statement, without loading the todo first
+        result = db.session.execute(db.delete(Todo).where(Todo.id == id))
+        if result.rowcount == 0:
+            db.session.rollback()
+            abort(404)
         db.session.commit()
         return jsonify({
             'success': True,
@@ -0,0 +1,26 @@
+"""index todo.created_at
+
+Revision ID: 61e7c7e4ba24
+Revises: 82aeb9bc2ca2
+Create Date: 2026-10-15 08:42:47.060798
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '61e7c7e4ba24'
+down_revision = '82aeb9bc2ca2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('todo', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_todo_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('todo', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_todo_created_at'))
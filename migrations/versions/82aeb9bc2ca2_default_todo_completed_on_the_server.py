@@ -0,0 +1,32 @@
+"""default todo.completed on the server
+
+Revision ID: 82aeb9bc2ca2
+Revises: 4bf5ff052d70
+Create Date: 2026-10-15 08:42:27.274103
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '82aeb9bc2ca2'
+down_revision = '4bf5ff052d70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('todo', schema=None) as batch_op:
+        batch_op.alter_column('completed',
+               existing_type=sa.Boolean(),
+               existing_nullable=False,
+               server_default=sa.false())
+
+
+def downgrade():
+    with op.batch_alter_table('todo', schema=None) as batch_op:
+        batch_op.alter_column('completed',
+               existing_type=sa.Boolean(),
+               existing_nullable=False,
+               server_default=None)
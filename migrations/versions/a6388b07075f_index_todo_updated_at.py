@@ -0,0 +1,26 @@
+"""index todo.updated_at
+
+Revision ID: a6388b07075f
+Revises: 61e7c7e4ba24
+Create Date: 2026-10-15 08:42:54.094879
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6388b07075f'
+down_revision = '61e7c7e4ba24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('todo', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_todo_updated_at'), ['updated_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('todo', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_todo_updated_at'))
@@ -1,18 +1,31 @@
 import pytest
+from contextlib import contextmanager
+from datetime import datetime
 from unittest.mock import patch
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
 from app import create_app
 from app.models import db, Todo
 
-# This fixture is run once per test module.
-@pytest.fixture(scope='module')
+# This fixture is run once per test session.
+@pytest.fixture(scope='session')
 def app():
-    """Create and configure a new app instance for each test module."""
+    """Create and configure a single app instance for the test session."""
     app = create_app('testing')
     
-    # Corrected line: removed the extra '.app'
     with app.app_context():
+        # pysqlite defers BEGIN and mishandles SAVEPOINT; let SQLAlchemy emit
+        # BEGIN itself so per-test transactions can be rolled back
+        @event.listens_for(db.engine, 'connect')
+        def disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(db.engine, 'begin')
+        def emit_begin(conn):
+            conn.exec_driver_sql('BEGIN')
+
         db.create_all()
         yield app
         db.drop_all()
@@ -25,12 +38,69 @@ def client(app):
 
 # This fixture is run for each test function, ensuring a clean database.
 @pytest.fixture(scope='function')
-def init_database(app):
-    """Clear all data from tables before each test."""
-    # Corrected line: removed the extra '.app'
-    with app.app_context():
-        db.session.query(Todo).delete()
-        db.session.commit()
+def init_database(app, monkeypatch):
+    """Run the test inside a transaction that is rolled back afterwards."""
+    # Requests share the session-wide app context, so end any transaction
+    # a previous test left open on its session first
+    db.session.remove()
+
+    connection = db.engine.connect()
+    transaction = connection.begin()
+
+    # Route every session through the connection; commits only release savepoints
+    db.session.configure(join_transaction_mode='create_savepoint')
+    monkeypatch.setattr(db.session.session_factory.class_, 'get_bind',
+                        lambda self, *args, **kwargs: connection)
+
+    # Every engine connection shares the one StaticPool DBAPI connection, so
+    # code that connects directly (e.g. the health check) gets a savepoint on
+    # the test connection instead of a transaction that would end the test's
+    @contextmanager
+    def connect_within_test_transaction():
+        with connection.begin_nested():
+            yield connection
+
+    monkeypatch.setattr(db.engine, 'connect', connect_within_test_transaction)
+
+    yield
+
+    db.session.remove()
+    db.session.configure(join_transaction_mode='conditional_savepoint')
+    transaction.rollback()
+    connection.close()
+
+
+class TestIndex:
+    """Test API root and error responses"""
+
+    def test_index(self, client, app):
+        """Test the API root describes the available endpoints"""
+        response = client.get('/')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        data = response.get_json()
+        assert data['version'] == '1.0.0'
+        assert data['endpoints'] == {'health': '/api/health', 'todos': '/api/todos'}
+        assert response.data == app.json.response(data).get_data()
+
+    def test_unknown_url_returns_json_404(self, client, app):
+        """Test unknown URLs return the JSON not-found payload"""
+        response = client.get('/no-such-page')
+        assert response.status_code == 404
+        assert response.mimetype == 'application/json'
+        data = response.get_json()
+        assert data['success'] is False
+        assert data['error'] == 'Resource not found'
+        assert response.data == app.json.response(data).get_data()
+
+    def test_prebuilt_bodies_follow_debug_formatting(self):
+        """Test prebuilt bodies are indented like jsonify output in debug mode"""
+        dev_app = create_app('development')
+        dev_client = dev_app.test_client()
+        for url in ('/', '/no-such-page'):
+            response = dev_client.get(url)
+            assert b'\n  "' in response.data
+            assert response.data == dev_app.json.response(response.get_json()).get_data()
 
 
 class TestHealthCheck:
@@ -44,7 +114,20 @@ class TestHealthCheck:
         assert data['status'] == 'healthy'
         assert data['database'] == 'connected'
 
-    @patch('app.routes.db.session.execute')
+    def test_health_endpoint_inside_test_transaction(self, client, init_database):
+        """Test health check leaves the test transaction and its data intact"""
+        client.post('/api/todos', json={'title': 'Before health check'})
+
+        response = client.get('/api/health')
+        assert response.status_code == 200
+        assert response.get_json()['database'] == 'connected'
+
+        assert client.get('/api/todos').get_json()['count'] == 1
+        response = client.post('/api/todos', json={'title': 'After health check'})
+        assert response.status_code == 201
+        assert client.get('/api/todos').get_json()['count'] == 2
+
+    @patch('sqlalchemy.engine.Connection.execute')
     def test_health_endpoint_database_error(self, mock_execute, client):
         """Test health check returns 503 when database is down"""
         mock_execute.side_effect = Exception('Database connection failed')
@@ -69,6 +152,71 @@ class TestTodoAPI:
         assert data['count'] == 0
         assert data['data'] == []
     
+    def test_get_todos_newest_first(self, client, app, init_database):
+        """Test listing todos returns serialized rows ordered by creation time"""
+        with app.app_context():
+            db.session.add(Todo(title='Older', created_at=datetime(2024, 1, 1)))
+            db.session.add(Todo(title='Newer', created_at=datetime(2024, 1, 2)))
+            db.session.commit()
+
+        response = client.get('/api/todos')
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['count'] == 2
+        assert [todo['title'] for todo in data['data']] == ['Newer', 'Older']
+        assert data['data'][0]['created_at'] == '2024-01-02T00:00:00Z'
+        assert data['data'][0]['completed'] is False
+    
+    def test_get_todos_query_count_independent_of_rows(self, client, app, init_database):
+        """Test listing todos emits a fixed number of SELECTs regardless of row count"""
+        with app.app_context():
+            db.session.add_all([Todo(title=f'Todo {i}') for i in range(5)])
+            db.session.commit()
+
+            statements = []
+
+            def count_statement(conn, cursor, statement, *args):
+                # Ignore the savepoints the test transaction wraps around the request
+                if statement.startswith('SELECT'):
+                    statements.append(statement)
+
+            event.listen(Engine, 'before_cursor_execute', count_statement)
+            try:
+                response = client.get('/api/todos')
+            finally:
+                event.remove(Engine, 'before_cursor_execute', count_statement)
+
+        assert response.get_json()['count'] == 5
+        # One aggregate for the ETag, one for the rows
+        assert len(statements) == 2
+
+    def test_get_todos_not_modified(self, client, app, init_database):
+        """Test listing todos returns 304 while the ETag still matches"""
+        with app.app_context():
+            db.session.add(Todo(title='Cached'))
+            db.session.commit()
+
+        response = client.get('/api/todos')
+        etag = response.headers['ETag']
+
+        response = client.get('/api/todos', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_get_todos_etag_changes_on_delete(self, client, app, init_database):
+        """Test deleting a todo invalidates the list ETag"""
+        with app.app_context():
+            db.session.add_all([Todo(title='Keep'), Todo(title='Remove')])
+            db.session.commit()
+            todo_id = db.session.scalar(db.select(Todo.id).where(Todo.title == 'Remove'))
+
+        etag = client.get('/api/todos').headers['ETag']
+        client.delete(f'/api/todos/{todo_id}')
+
+        response = client.get('/api/todos', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['count'] == 1
+    
     def test_create_todo(self, client, init_database):
         """Test creating a new todo"""
         todo_data = {'title': 'New Todo', 'description': 'A test todo'}
@@ -77,6 +225,7 @@ class TestTodoAPI:
         data = response.get_json()
         assert data['success'] is True
         assert data['data']['title'] == 'New Todo'
+        assert data['data']['completed'] is False
 
     def test_create_todo_without_title_fails(self, client, init_database):
         """Test creating todo without title fails"""
@@ -84,6 +233,11 @@ class TestTodoAPI:
         assert response.status_code == 400
         assert b'Title is required' in response.data
 
+    def test_create_todo_with_invalid_json_fails(self, client, init_database):
+        """Test creating todo with a malformed JSON body fails"""
+        response = client.post('/api/todos', data='{"title": ', content_type='application/json')
+        assert response.status_code == 400
+
     @patch('app.routes.db.session.commit')
     def test_create_todo_db_error(self, mock_commit, client, init_database):
         """Test a database error during todo creation"""
@@ -92,6 +246,39 @@ class TestTodoAPI:
         assert response.status_code == 500
         assert b'Database error' in response.data
     
+    def test_create_todos_bulk(self, client, init_database):
+        """Test creating several todos in one request"""
+        items = [{'title': 'First'}, {'title': 'Second', 'description': 'Two'}]
+        response = client.post('/api/todos/bulk', json={'items': items})
+        assert response.status_code == 201
+        assert response.get_json()['count'] == 2
+
+        data = client.get('/api/todos').get_json()
+        assert data['count'] == 2
+        assert {todo['title'] for todo in data['data']} == {'First', 'Second'}
+
+    def test_create_todos_bulk_without_items_fails(self, client, init_database):
+        """Test bulk creation without items fails"""
+        response = client.post('/api/todos/bulk', json={'items': []})
+        assert response.status_code == 400
+        assert b'Items are required' in response.data
+
+    def test_create_todos_bulk_without_title_fails(self, client, init_database):
+        """Test bulk creation fails if any item lacks a title"""
+        items = [{'title': 'Valid'}, {'description': 'No title'}]
+        response = client.post('/api/todos/bulk', json={'items': items})
+        assert response.status_code == 400
+        assert b'Title is required' in response.data
+        assert client.get('/api/todos').get_json()['count'] == 0
+
+    @patch('app.routes.db.session.commit')
+    def test_create_todos_bulk_db_error(self, mock_commit, client, init_database):
+        """Test a database error during bulk creation"""
+        mock_commit.side_effect = SQLAlchemyError("DB connection error")
+        response = client.post('/api/todos/bulk', json={'items': [{'title': 'Will Fail'}]})
+        assert response.status_code == 500
+        assert b'Database error' in response.data
+    
     def test_get_specific_todo(self, client, app, init_database):
         """Test getting a specific todo by ID"""
         # Corrected line: removed the extra '.app'
@@ -126,6 +313,31 @@ class TestTodoAPI:
         assert data['data']['title'] == 'Updated Title'
         assert data['data']['completed'] is True
 
+    def test_update_todo_with_blank_title_fails(self, client, app, init_database):
+        """Test updating a todo with a blank title fails and keeps the old title"""
+        with app.app_context():
+            todo = Todo(title='Keep Me')
+            db.session.add(todo)
+            db.session.commit()
+            todo_id = todo.id
+
+        response = client.put(f'/api/todos/{todo_id}', json={'title': '  '})
+        assert response.status_code == 400
+        assert b'Title is required' in response.data
+        assert client.get(f'/api/todos/{todo_id}').get_json()['data']['title'] == 'Keep Me'
+
+    def test_update_todo_with_non_object_body_fails(self, client, app, init_database):
+        """Test updating a todo with a non-object JSON body fails"""
+        with app.app_context():
+            todo = Todo(title='Original Title')
+            db.session.add(todo)
+            db.session.commit()
+            todo_id = todo.id
+
+        response = client.put(f'/api/todos/{todo_id}', json=[1])
+        assert response.status_code == 400
+        assert b'Title is required' in response.data
+
     def test_update_nonexistent_todo(self, client):
         """Test updating a non-existent todo returns 404"""
         response = client.put('/api/todos/99999', json={'title': 'No one here'})
@@ -182,3 +394,25 @@ class TestTodoAPI:
         response = client.delete(f'/api/todos/{todo_id}')
         assert response.status_code == 500
         assert b'Database error' in response.data
+
+
+class TestJSONProvider:
+    """Test the orjson-backed JSON provider"""
+
+    def test_app_uses_orjson_provider(self, app):
+        """Test the app serializes JSON with the orjson provider"""
+        from app.json_provider import OrjsonProvider
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_naive_datetime_encoded_as_utc(self, app):
+        """Test naive datetimes are encoded as ISO 8601 with a Z suffix"""
+        data = app.json.dumps({'at': datetime(2024, 1, 2, 3, 4, 5)})
+        assert data == '{"at":"2024-01-02T03:04:05Z"}'
+
+    def test_non_str_keys(self, app):
+        """Test non-string dict keys are encoded like the default provider"""
+        assert app.json.dumps({2: 'b', 1: 'a'}) == '{"1":"a","2":"b"}'
+
+    def test_loads(self, app):
+        """Test the provider parses JSON"""
+        assert app.json.loads(b'{"title": "Parsed"}') == {'title': 'Parsed'}
@@ -37,6 +37,13 @@ class TestTestingConfig:
         """Test testing uses SQLite in-memory database"""
         assert 'sqlite:///:memory:' in TestingConfig.SQLALCHEMY_DATABASE_URI
     
+    def test_uses_static_pool(self):
+        """Test the in-memory database is backed by a single shared connection"""
+        from sqlalchemy.pool import StaticPool
+        options = TestingConfig.SQLALCHEMY_ENGINE_OPTIONS
+        assert options['poolclass'] is StaticPool
+        assert options['connect_args']['check_same_thread'] is False
+    
     def test_csrf_disabled(self):
         """Test CSRF is disabled for testing"""
         assert TestingConfig.WTF_CSRF_ENABLED is False
@@ -48,6 +55,13 @@ class TestProductionConfig:
         """Test debug mode is disabled in production"""
         assert ProductionConfig.DEBUG is False
     
+    def test_connection_pool_configured(self):
+        """Test production configures the connection pool"""
+        options = ProductionConfig.SQLALCHEMY_ENGINE_OPTIONS
+        assert options['pool_size'] == 10
+        assert options['max_overflow'] == 20
+        assert options['pool_pre_ping'] is True
+    
     def test_requires_database_url(self, monkeypatch):
         """Test production requires DATABASE_URL environment variable"""
         # Remove DATABASE_URL if it exists
@@ -69,4 +83,42 @@ class TestConfigSelector:
     
     def test_default_is_development(self):
         """Test default configuration is development"""
-        assert config['default'] == DevelopmentConfig
\ No newline at end of file
+        assert config['default'] == DevelopmentConfig
+    
+    def test_create_app_loads_selected_config(self):
+        """Test create_app applies the settings of the selected config"""
+        from app import create_app
+        app = create_app('testing')
+        assert app.config['TESTING'] is True
+        assert app.config['SQLALCHEMY_DATABASE_URI'] == TestingConfig.SQLALCHEMY_DATABASE_URI
+    
+    def test_create_app_reads_current_config_values(self, monkeypatch, tmp_path):
+        """Test create_app sees config class changes made after an earlier call"""
+        from app import create_app
+        database_uri = f"sqlite:///{tmp_path / 'app.db'}"
+        monkeypatch.setattr(ProductionConfig, 'SQLALCHEMY_DATABASE_URI', database_uri)
+        create_app('production')
+        
+        monkeypatch.setattr(ProductionConfig, 'SQLALCHEMY_DATABASE_URI', None)
+        with pytest.raises(AssertionError):
+            create_app('production')
+
+class TestMigrateRegistration:
+    """Test Flask-Migrate is only registered for the CLI"""
+    
+    def test_not_registered_outside_cli(self, monkeypatch):
+        """Test Flask-Migrate is skipped when not running from the flask CLI"""
+        monkeypatch.delenv('FLASK_RUN_FROM_CLI', raising=False)
+        monkeypatch.setattr('sys.argv', ['gunicorn'])
+        
+        from app import create_app
+        app = create_app('testing')
+        assert 'migrate' not in app.extensions
+    
+    def test_registered_from_cli(self, monkeypatch):
+        """Test Flask-Migrate is registered when running from the flask CLI"""
+        monkeypatch.setenv('FLASK_RUN_FROM_CLI', 'true')
+        
+        from app import create_app
+        app = create_app('testing')
+        assert 'migrate' in app.extensions